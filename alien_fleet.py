@@ -5,13 +5,15 @@ Jonathan Carpenter
 This module defines the AlienFleet class, which manages a group of Alien (X-Wing)
 sprites in the Star Wars-themed Alien Invasion game. It creates an X-shaped
 fleet formation, handles fleet movement (side-to-side with drops at edges),
-updates all aliens, draws them, checks collisions with bullets, and detects
-when the fleet is fully destroyed or reaches the bottom of the screen.
+keeps the fleet layout in a single NumPy array, draws it, checks
+collisions with bullets, and detects when the fleet is fully destroyed or
+reaches the bottom of the screen.
 
 date: 12/15/2025
 """
 
 
+import numpy as np
 import pygame
 from alien import Alien
 from typing import TYPE_CHECKING
@@ -19,6 +21,10 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from alien_invasion import AlienInvasion
 
+# Formation coordinates depend only on screen and alien size, so they are
+# computed once per (screen_w, screen_h, alien_w, alien_h) and reused
+_FLEET_LAYOUT_CACHE: dict[tuple[int, int, int, int], list[tuple[int, int]]] = {}
+
 class AlienFleet:
     """
     Manages the entire fleet of enemy aliens (X-Wings).
@@ -27,12 +33,34 @@ class AlienFleet:
     moving the fleet as a cohesive unit, detecting edge collisions, dropping
     the fleet downward, and handling collisions with player bullets.
 
+    The layout lives in one (N, 4) int32 array of alien rects relative to the
+    fleet's top-left corner. The fleet moves rigidly, so a frame only advances
+    that corner and the cached bounds; no per-alien Rect is kept or updated.
+
     Attributes:
         game (AlienInvasion): Reference to the main game instance.
         settings (Settings): Game settings containing dimensions and speeds.
         fleet (pygame.sprite.Group): Group containing all active Alien instances.
         fleet_direction (int): 1 for right, -1 for left movement.
         fleet_drop_speed (float): Vertical distance the fleet drops when hitting an edge.
+        screen_left (int): Left screen edge the fleet turns around at.
+        screen_right (int): Right screen edge the fleet turns around at.
+        alien_image (pygame.Surface): Scaled X-Wing image shared by every Alien.
+        aliens (list[Alien]): Live aliens, in the same order as ``rects_arr``.
+        rects_arr (numpy.ndarray): (N, 4) int32 array of (x, y, w, h) per live alien,
+            relative to (fleet_min_x, fleet_min_y).
+        fleet_min_x (float): Left edge of the leftmost live alien.
+        fleet_max_x (float): Left edge of the rightmost live alien.
+        fleet_min_y (float): Top edge of the highest live alien.
+        fleet_max_y (float): Top edge of the lowest live alien.
+        fleet_size (tuple[int, int]): Width and height of the box enclosing every
+            live alien.
+        draw_offsets (list[tuple[int, int]]): Each live alien's (x, y) offset from
+            (fleet_min_x, fleet_min_y), used to batch the fleet into one blits call.
+        grid (dict[tuple[int, int], list[tuple[Alien, tuple]]]): Spatial hash of live
+            aliens and their relative rects, keyed by (column, row) cell from the
+            fleet's top-left corner.
+        _alien_pool (list[Alien]): Preallocated aliens reused by every new fleet.
     """
 
     def __init__(self, game: 'AlienInvasion'):
@@ -50,6 +78,17 @@ class AlienFleet:
         self.fleet = pygame.sprite.Group()
         self.fleet_direction = self.settings.fleet_direction
         self.fleet_drop_speed = self.settings.fleet_drop_speed
+        self.screen_left = 0
+        self.screen_right = self.settings.screen_w
+
+        # Load and scale the X-Wing once; every Alien shares this surface
+        self.alien_image = pygame.image.load(self.settings.alien_file)
+        self.alien_image = pygame.transform.scale(self.alien_image, (self.settings.alien_w, self.settings.alien_h)).convert_alpha()
+
+        # One X formation needs fleet_w + fleet_h - 1 aliens; allocate them once
+        fleet_w, fleet_h = self.calculate_fleet_size(self.settings.alien_w, self.settings.screen_w,
+                                                     self.settings.alien_h, self.settings.screen_h)
+        self._alien_pool = [Alien(self) for _ in range(fleet_w + fleet_h - 1)]
 
         self.create_fleet()
 
@@ -58,16 +97,30 @@ class AlienFleet:
         Create the full X-shaped alien fleet centered on the upper half of the screen.
 
         Calculates fleet size based on screen and alien dimensions, then positions
-        aliens along the main and anti-diagonals to form an "X".
+        aliens along the main and anti-diagonals to form an "X". Any aliens still
+        in the fleet are cleared first, and the new ones are taken from the pool.
+        The coordinates are cached, so later fleets skip the layout math.
 
         Returns:
             None
         """
+        self.fleet.empty()
+        self._pool_index = 0
+        self._placements = []
+
         alien_w = self.settings.alien_w
         alien_h = self.settings.alien_h
         screen_w = self.settings.screen_w
         screen_h = self.settings.screen_h
 
+        key = (screen_w, screen_h, alien_w, alien_h)
+        layout = _FLEET_LAYOUT_CACHE.get(key)
+        if layout is not None:
+            for current_x, current_y in layout:
+                self._create_alien(current_x, current_y)
+            self._build_layout()
+            return
+
         fleet_w, fleet_h = self.calculate_fleet_size(alien_w, screen_w, alien_h, screen_h)
 
         half_screen = self.settings.screen_h//2
@@ -77,6 +130,107 @@ class AlienFleet:
         y_offset = int((half_screen-fleet_verticle_space)//2)
 
         self._create_x_fleet(alien_w, alien_h, fleet_w, fleet_h, x_offset, y_offset)
+        _FLEET_LAYOUT_CACHE[key] = [(current_x, current_y) for _, current_x, current_y in self._placements]
+        self._build_layout()
+
+    def _build_layout(self):
+        """
+        Build the layout array from the aliens placed by the current formation.
+
+        Returns:
+            None
+        """
+        alien_w = self.settings.alien_w
+        alien_h = self.settings.alien_h
+        self.aliens = [alien for alien, _, _ in self._placements]
+        self.rects_arr = np.array([(x, y, alien_w, alien_h) for _, x, y in self._placements],
+                                  dtype=np.int32).reshape(-1, 4)
+        # Placements are in screen space; _update_fleet_bounds re-anchors them
+        self.fleet_min_x = self.fleet_min_y = 0.0
+        self._rebuild_fleet_caches()
+
+    def _remove_dead_aliens(self):
+        """
+        Drop killed aliens from the layout array, keeping the fleet's position.
+
+        Returns:
+            None
+        """
+        alive = np.fromiter((alien.alive() for alien in self.aliens), dtype=bool, count=len(self.aliens))
+        self.aliens = [alien for alien, keep in zip(self.aliens, alive) if keep]
+        self.rects_arr = self.rects_arr[alive]
+        self._rebuild_fleet_caches()
+
+    def _rebuild_fleet_caches(self):
+        """
+        Refresh everything derived from the fleet layout after it changes.
+
+        Returns:
+            None
+        """
+        self._update_fleet_bounds()
+        self._build_draw_offsets()
+        self._build_collision_grid()
+
+    def _update_fleet_bounds(self):
+        """
+        Re-anchor the layout on the live fleet's top-left corner and refresh the bounds.
+
+        The fleet moves rigidly, so the bounds only need a full recompute when
+        the fleet is created or loses aliens; otherwise they move with the fleet.
+
+        Returns:
+            None
+        """
+        if not len(self.rects_arr):
+            self.fleet_max_x = self.fleet_min_x
+            self.fleet_max_y = self.fleet_min_y
+            return
+
+        shift_x, shift_y = self.rects_arr[:, :2].min(axis=0).tolist()
+        self.rects_arr[:, 0] -= shift_x
+        self.rects_arr[:, 1] -= shift_y
+        self.fleet_min_x += shift_x
+        self.fleet_min_y += shift_y
+
+        span_x, span_y = self.rects_arr[:, :2].max(axis=0).tolist()
+        self.fleet_max_x = self.fleet_min_x + span_x
+        self.fleet_max_y = self.fleet_min_y + span_y
+
+    def _build_draw_offsets(self):
+        """
+        Cache each live alien's drawing offset and the size of the whole fleet.
+
+        The formation keeps its shape while it moves, so these only have to be
+        rebuilt when the fleet is created or loses aliens. Drawing the aliens
+        individually beats a composited fleet surface, since the X formation
+        leaves most of its bounding box empty.
+
+        Returns:
+            None
+        """
+        if len(self.rects_arr):
+            self.fleet_size = tuple((self.rects_arr[:, :2] + self.rects_arr[:, 2:]).max(axis=0).tolist())
+        else:
+            self.fleet_size = (0, 0)
+        self.draw_offsets = [tuple(offset) for offset in self.rects_arr[:, :2].tolist()]
+
+    def _build_collision_grid(self):
+        """
+        Hash every live alien into an alien-sized cell relative to the fleet's corner.
+
+        The fleet moves rigidly, so cells stay valid until the fleet is rebuilt or
+        loses aliens; bullets are mapped into the same cells when checking hits.
+
+        Returns:
+            None
+        """
+        alien_w = self.settings.alien_w
+        alien_h = self.settings.alien_h
+        self.grid = {}
+        for alien, rect in zip(self.aliens, self.rects_arr.tolist()):
+            cell = (rect[0] // alien_w, rect[1] // alien_h)
+            self.grid.setdefault(cell, []).append((alien, tuple(rect)))
 
     def _create_x_fleet(self, alien_w, alien_h, fleet_w, fleet_h, x_offset, y_offset):
         """
@@ -93,13 +247,13 @@ class AlienFleet:
         Returns:
             None
         """
+        # Emit the main diagonal and anti-diagonal cells of each row directly
         for row in range(fleet_h):
-            for col in range(fleet_w):
-                # Place alien on main diagonal or anti-diagonal
-                if col == row or col == (fleet_w - 1 - row):
-                    current_x = col * alien_w + x_offset
-                    current_y = row * alien_h + y_offset
-                    self._create_alien(current_x, current_y)
+            current_y = row * alien_h + y_offset
+            self._create_alien(row * alien_w + x_offset, current_y)
+            anti_col = fleet_w - 1 - row
+            if anti_col != row:
+                self._create_alien(anti_col * alien_w + x_offset, current_y)
 
     def _create_rectangle_fleet(self, alien_w, alien_h, fleet_w, fleet_h, x_offset, y_offset):
         """
@@ -164,7 +318,9 @@ class AlienFleet:
 
     def _create_alien(self, current_x: int, current_y: int):
         """
-        Create and add a single Alien instance at the specified pixel coordinates.
+        Add the next pooled Alien to the fleet at the specified pixel coordinates.
+
+        The pool only grows if a formation needs more aliens than it holds.
 
         Args:
             current_x (int): Horizontal position of the alien.
@@ -173,22 +329,33 @@ class AlienFleet:
         Returns:
             None
         """
-        new_alien = Alien(self, current_x, current_y)
+        if self._pool_index == len(self._alien_pool):
+            self._alien_pool.append(Alien(self))
+        new_alien = self._alien_pool[self._pool_index]
+        self._pool_index += 1
         self.fleet.add(new_alien)
+        self._placements.append((new_alien, current_x, current_y))
 
     def _check_fleet_edges(self):
         """
-        Check if any alien has reached a horizontal edge; if so, reverse direction and drop.
+        Check if the fleet has reached a horizontal edge; if so, reverse direction and drop.
+
+        Only the edge the fleet is moving toward counts, so a long frame that carries
+        the fleet past an edge cannot trigger a second turn and drop on the next,
+        shorter frame before it has moved back inside.
 
         Returns:
             None
         """
-        alien: Alien
-        for alien in self.fleet:
-            if alien.check_edges():
-                self._drop_alien_fleet()
-                self.fleet_direction *= -1
-                break
+        if not self.aliens:
+            return
+        if self.fleet_direction > 0:
+            at_edge = self.fleet_max_x + self.settings.alien_w >= self.screen_right
+        else:
+            at_edge = self.fleet_min_x <= self.screen_left
+        if at_edge:
+            self._drop_alien_fleet()
+            self.fleet_direction *= -1
 
     def _drop_alien_fleet(self):
         """
@@ -197,45 +364,169 @@ class AlienFleet:
         Returns:
             None
         """
-        for alien in self.fleet:
-            alien.y += self.fleet_drop_speed
+        self.fleet_min_y += self.fleet_drop_speed
+        self.fleet_max_y += self.fleet_drop_speed
 
-    def update_fleet(self):
+    def update_fleet(self, dt: float):
         """
-        Update the position of the entire fleet (edge checking + individual updates).
+        Update the position of the entire fleet (edge checking + rigid movement).
 
         Called once per frame when the game is active.
 
+        Args:
+            dt (float): Seconds elapsed since the last frame.
+
         Returns:
             None
         """
         self._check_fleet_edges()
-        self.fleet.update()
+        dx = self.settings.fleet_speed * self.fleet_direction * dt
+        self.fleet_min_x += dx
+        self.fleet_max_x += dx
 
     def draw(self):
         """
-        Draw all aliens in the fleet to the screen.
+        Draw all aliens in the fleet to the screen with a single blits call.
 
         Returns:
             None
         """
-        alien: 'Alien'
-        for alien in self.fleet:
-            alien.draw_alien()
+        origin_x = round(self.fleet_min_x)
+        origin_y = round(self.fleet_min_y)
+        image = self.alien_image
+        self.game.screen.blits([(image, (origin_x + x, origin_y + y)) for x, y in self.draw_offsets],
+                               doreturn=False)
+
+    def collide_all(self, ship_rect, bullets):
+        """
+        Check the ship and the player's bullets against the fleet in one call.
+
+        Both checks go through the fleet's bounding rect and then the same
+        spatial-hash grid, so the fleet is never scanned. The ship only needs a
+        yes/no answer, so its nearby alien rects go to one short-circuiting
+        collidelist call. Bullets are skipped when the ship is hit, since the
+        level resets.
+
+        Args:
+            ship_rect (pygame.Rect): Rect of the player's ship.
+            bullets (pygame.sprite.Group): Group of the player's bullets.
+
+        Returns:
+            tuple[bool, dict]: Whether the ship was hit, and the collision dictionary
+                               from check_collisions (empty when the ship was hit).
+        """
+        if (self.grid and self._fleet_rect().colliderect(ship_rect)
+                and ship_rect.collidelist(self._cell_rects(*self._grid_cells(ship_rect))) != -1):
+            return True, {}
+        return False, self.check_collisions(bullets)
 
     def check_collisions(self, other_group):
         """
         Check for collisions between aliens and another sprite group (typically bullets).
 
-        Removes both the alien and the bullet on collision.
+        The bullet rects are gathered once and culled against the fleet's bounding
+        rect in a single collidelistall call; each remaining bullet is only tested
+        against the aliens hashed into the grid cells its rect covers. Removes both
+        the alien and the bullet on collision.
 
         Args:
             other_group (pygame.sprite.Group): Group to check against (usually bullets).
 
         Returns:
-            dict: Collision dictionary from pygame.sprite.groupcollide.
+            dict: Maps each destroyed alien to the list of bullets that hit it,
+                  matching pygame.sprite.groupcollide.
+        """
+        collisions = {}
+        if not self.grid:
+            return collisions
+
+        bullets = other_group.sprites()
+        bullet_rects = [bullet.rect for bullet in bullets]
+        for index in self._fleet_rect().collidelistall(bullet_rects):
+            bullet = bullets[index]
+            hit = self._find_hit(bullet.rect, *self._grid_cells(bullet.rect))
+            if hit is not None:
+                collisions.setdefault(hit, []).append(bullet)
+                bullet.kill()
+
+        if collisions:
+            for alien in collisions:
+                alien.kill()
+            self._remove_dead_aliens()
+        return collisions
+
+    def _fleet_rect(self):
+        """
+        Return the screen-space bounding rect of the live fleet.
+
+        Returns:
+            pygame.Rect: Rect enclosing every live alien.
+        """
+        return pygame.Rect((round(self.fleet_min_x), round(self.fleet_min_y)), self.fleet_size)
+
+    def _grid_cells(self, rect):
+        """
+        Return the block of grid cells a screen-space rect covers.
+
+        Args:
+            rect (pygame.Rect): Rect to map into the fleet grid.
+
+        Returns:
+            tuple[int, int, int, int]: First column, last column, first row and last row.
+        """
+        origin_x = round(self.fleet_min_x)
+        origin_y = round(self.fleet_min_y)
+        alien_w = self.settings.alien_w
+        alien_h = self.settings.alien_h
+        return ((rect.left - origin_x) // alien_w, (rect.right - 1 - origin_x) // alien_w,
+                (rect.top - origin_y) // alien_h, (rect.bottom - 1 - origin_y) // alien_h)
+
+    def _cell_rects(self, first_col, last_col, first_row, last_row):
+        """
+        Return the screen-space rects of every alien in a block of grid cells.
+
+        Args:
+            first_col (int): First grid column of the block.
+            last_col (int): Last grid column of the block.
+            first_row (int): First grid row of the block.
+            last_row (int): Last grid row of the block.
+
+        Returns:
+            list[tuple[int, int, int, int]]: (x, y, w, h) rects at the fleet's drawn position.
+        """
+        origin_x = round(self.fleet_min_x)
+        origin_y = round(self.fleet_min_y)
+        grid = self.grid
+        return [(origin_x + x, origin_y + y, w, h)
+                for row in range(first_row, last_row + 1)
+                for col in range(first_col, last_col + 1)
+                for _, (x, y, w, h) in grid.get((col, row), ())]
+
+    def _find_hit(self, rect, first_col, last_col, first_row, last_row):
+        """
+        Return the first alien in the given block of grid cells that overlaps a rect.
+
+        Alien rects are rebuilt on the fly from the grid's relative rects and the
+        fleet's rounded top-left corner, the same position the fleet is drawn at.
+
+        Args:
+            rect (pygame.Rect): Rect to test (usually a bullet).
+            first_col (int): First grid column covered by the rect.
+            last_col (int): Last grid column covered by the rect.
+            first_row (int): First grid row covered by the rect.
+            last_row (int): Last grid row covered by the rect.
+
+        Returns:
+            Alien | None: The overlapping alien, or None if nothing was hit.
         """
-        return pygame.sprite.groupcollide(self.fleet, other_group, True, True)
+        origin_x = round(self.fleet_min_x)
+        origin_y = round(self.fleet_min_y)
+        for row in range(first_row, last_row + 1):
+            for col in range(first_col, last_col + 1):
+                for alien, (x, y, w, h) in self.grid.get((col, row), ()):
+                    if rect.colliderect((origin_x + x, origin_y + y, w, h)):
+                        return alien
+        return None
 
     def check_fleet_bottom(self):
         """
@@ -244,11 +535,9 @@ class AlienFleet:
         Returns:
             bool: True if any alien touches or passes the bottom edge.
         """
-        alien: Alien
-        for alien in self.fleet:
-            if alien.rect.bottom >= self.settings.screen_h:
-                return True
-        return False
+        if not self.aliens:
+            return False
+        return self.fleet_max_y + self.settings.alien_h >= self.settings.screen_h
     
     def check_destroyed_status(self):
         """
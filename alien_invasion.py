@@ -60,7 +60,7 @@ class AlienInvasion:
         pygame.display.set_caption(self.settings.name)
 
         self.bg = pygame.image.load(self.settings.bg_file)
-        self.bg = pygame.transform.scale(self.bg, (self.settings.screen_w, self.settings.screen_h))
+        self.bg = pygame.transform.scale(self.bg, (self.settings.screen_w, self.settings.screen_h)).convert()
 
         self.game_stats = GameStats(self)
         self.HUD = HUD(self)
@@ -89,19 +89,21 @@ class AlienInvasion:
         Start the main game loop.
 
         Handles events, updates game state when active, and redraws the screen.
+        Movement is scaled by the time since the last frame, so game speed does
+        not depend on the frame rate.
 
         Returns:
             None
         """
         # Game loop
         while self.running:
+            dt = min(self.clock.tick(self.settings.FPS) / 1000.0, self.settings.max_frame_time)
             self._check_events()
             if self.game_active:
-                self.ship.update()
-                self.alien_fleet.update_fleet()
+                self.ship.update(dt)
+                self.alien_fleet.update_fleet(dt)
                 self._check_collisions()
             self._update_screen()
-            self.clock.tick(self.settings.FPS)
     
     def _check_collisions(self):
         """
@@ -112,9 +114,10 @@ class AlienInvasion:
         Returns:
             None
         """
-        if self.ship.check_collisions(self.alien_fleet.fleet):
+        ship_hit, collisions = self.alien_fleet.collide_all(self.ship.rect, self.ship.arsenal.arsenal)
+        if ship_hit:
+            self.ship._center_ship()
             self._check_game_stats()
-        collisions = self.alien_fleet.check_collisions(self.ship.arsenal.arsenal)
         if collisions:
             self.impact_sound.play()
             self.impact_sound.fadeout(800)
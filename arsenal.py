@@ -5,7 +5,8 @@ Jonathan Carpenter
 This module defines the Arsenal class, which manages the collection of bullets
 (green laser blasts) fired by the player's TIE Fighter in the Star Wars-themed
 Alien Invasion game. It limits the number of simultaneous bullets, updates their
-positions, removes off-screen bullets, draws them, and handles firing new ones.
+positions, removes off-screen bullets, hands them to the ship for drawing, and
+handles firing new ones.
 
 date: 12/15/2025
 """
@@ -32,12 +33,13 @@ class Arsenal:
         game (AlienInvasion): Reference to the main game instance.
         settings (Settings): Game settings containing the bullet limit.
         arsenal (pygame.sprite.Group): Group containing all active Bullet sprites.
+        bullet_image (pygame.Surface): Scaled laser image shared by every Bullet.
     """
 
 
     def __init__(self, game: 'AlienInvasion'):
         """
-        Initialize the arsenal and create an empty bullet group.
+        Initialize the arsenal, load the shared laser image, and create an empty bullet group.
 
         Args:
             game (AlienInvasion): The main game instance, providing access to settings.
@@ -49,40 +51,49 @@ class Arsenal:
         self.settings = game.settings
         self.arsenal = pygame.sprite.Group()
 
-    def update_arsenal(self):
+        # Load and scale the laser once; every Bullet shares this surface
+        self.bullet_image = pygame.image.load(self.settings.bullet_file)
+        self.bullet_image = pygame.transform.scale(self.bullet_image, (self.settings.bullet_w, self.settings.bullet_h)).convert_alpha()
+
+    def update_arsenal(self, dt: float):
         """
         Update positions of all bullets and remove those that have left the screen.
 
         Called once per frame when the game is active.
 
+        Args:
+            dt (float): Seconds elapsed since the last frame.
+
         Returns:
             None
         """
-        self.arsenal.update()
+        # Work out the step once and hand it to every bullet through Group.update
+        dy = self.settings.bullet_speed * dt
+        self.arsenal.update(dy)
         self._remove_bullets_offscreen()
 
     def _remove_bullets_offscreen(self):
         """
         Remove bullets that have moved off the top edge of the screen.
 
-        Iterates over a copy of the group to safely remove items during iteration.
+        Collects the offscreen bullets first and removes them in one batch call,
+        so frames with nothing to cull never copy the group.
 
         Returns:
             None
         """
-        for bullet in self.arsenal.copy():
-            if bullet.rect.bottom <= 0:
-                self.arsenal.remove(bullet)
+        dead = [bullet for bullet in self.arsenal if bullet.rect.bottom <= 0]
+        if dead:
+            self.arsenal.remove(*dead)
     
-    def draw(self):
+    def blit_sequence(self):
         """
-        Draw all active bullets to the screen.
+        Collect every active bullet as a (surface, rect) pair for a batched blit.
 
         Returns:
-            None
+            list[tuple[pygame.Surface, pygame.Rect]]: One entry per bullet.
         """
-        for bullet in self.arsenal:
-            bullet.draw_bullet()
+        return [(bullet.image, bullet.rect) for bullet in self.arsenal]
     
     def fire_bullet(self):
         """
@@ -95,7 +106,7 @@ class Arsenal:
             bool: True if a bullet was fired, False if the limit was reached.
         """
         if len(self.arsenal) < self.settings.bullet_amount:
-            new_bullet = Bullet(self.game)
+            new_bullet = Bullet(self)
             self.arsenal.add(new_bullet)
             return True
         return False
\ No newline at end of file
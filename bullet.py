@@ -16,7 +16,7 @@ from pygame.sprite import Sprite
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from alien_invasion import AlienInvasion
+    from arsenal import Arsenal
 
 class Bullet(Sprite):
     """
@@ -25,53 +25,41 @@ class Bullet(Sprite):
     Bullets move straight upward at a constant speed and are drawn as scaled images.
 
     Attributes:
-        screen (pygame.Surface): The main game screen surface.
-        settings (Settings): Game settings containing bullet dimensions and speed.
-        image (pygame.Surface): Scaled image of the green laser blast.
+        image (pygame.Surface): Scaled laser image shared across the arsenal.
         rect (pygame.Rect): Rectangular area for positioning and collision detection.
         y (float): Precise vertical position for smooth movement.
     """
 
 
-    def __init__(self, game: 'AlienInvasion'):
+    def __init__(self, arsenal: 'Arsenal'):
         """
         Create a new bullet at the ship's current position.
 
         Args:
-            game (AlienInvasion): The main game instance, providing access to screen,
-                                  settings, and the player's ship position.
+            arsenal (Arsenal): The Arsenal instance managing this bullet, providing
+                               access to the shared image and the main game.
 
         Returns:
             None
         """
         super().__init__()
-        self.screen = game.screen
-        self.settings = game.settings
-
-        self.image = pygame.image.load(self.settings.bullet_file)
-        self.image = pygame.transform.scale(self.image, (self.settings.bullet_w, self.settings.bullet_h))
+        self.image = arsenal.bullet_image
 
         self.rect = self.image.get_rect()
-        self.rect.midtop = game.ship.rect.midtop
+        self.rect.midtop = arsenal.game.ship.rect.midtop
         self.y = float(self.rect.y)
     
-    def update(self):
+    def update(self, dy: float):
         """
         Move the bullet upward by updating its position.
 
         Called once per frame by the sprite group.
 
-        Returns:
-            None
-        """
-        self.y -= self.settings.bullet_speed
-        self.rect.y = self.y
-    
-    def draw_bullet(self):
-        """
-        Draw the bullet (laser) to the screen at its current position.
+        Args:
+            dy (float): Distance in pixels to move this frame, precomputed by the Arsenal.
 
         Returns:
             None
         """
-        self.screen.blit(self.image, self.rect)
\ No newline at end of file
+        self.y -= dy
+        self.rect.y = self.y
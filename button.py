@@ -9,7 +9,8 @@ high score, level, and remaining ship lives in the Alien Invasion game.
 date: 12/14/2025
 """
 
-import pygame.font
+import pygame
+from font_cache import get_font
 
 from typing import TYPE_CHECKING
 
@@ -25,7 +26,7 @@ class Button:
         screen (pygame.Surface): The main game screen surface.
         boundaries (pygame.Rect): Rect representing the screen boundaries.
         settings (Settings): Game settings object containing colors, sizes, etc.
-        font (pygame.font.Font): Font object used to render button text.
+        font (pygame.freetype.Font): Font object used to render button text.
         rect (pygame.Rect): Rectangular area of the button.
         msg_image (pygame.Surface): Rendered image of the button's text.
         msg_image_rect (pygame.Rect): Rect for positioning the text image.
@@ -46,7 +47,7 @@ class Button:
         self.screen = game.screen
         self.boundaries = game.screen.get_rect()
         self.settings = game.settings
-        self.font = pygame.font.Font(self.settings.font_file, self.settings.button_font_size)
+        self.font = get_font(self.settings.font_file, self.settings.button_font_size)
         self.rect = pygame.Rect(0,0, self.settings.button_w, self.settings.button_h)
         self.rect.center = self.boundaries.center
         self._prep_msg(msg)
@@ -64,7 +65,7 @@ class Button:
         Returns:
             None
         """
-        self.msg_image = self.font.render(msg, True, self.settings.text_color, None)
+        self.msg_image, _ = self.font.render(msg, self.settings.text_color)
         self.msg_image_rect = self.msg_image.get_rect()
         self.msg_image_rect.center = self.rect.center
     
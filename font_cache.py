@@ -0,0 +1,35 @@
+"""
+Font Cache Module
+
+This module keeps one pygame.freetype Font object per (font file, size) pair so
+that the HUD, buttons, and any later UI elements share loaded fonts instead of
+parsing the TTF file again each time one is created.
+"""
+
+import pygame.freetype
+
+
+_cache: dict[tuple[str, int], pygame.freetype.Font] = {}
+
+
+def get_font(path, size: int) -> pygame.freetype.Font:
+    """
+    Return the cached font for a file and size, loading it on first use.
+
+    Fonts are padded so rendered text gets full line-height rects, which keeps
+    separately rendered labels and digits on a common baseline.
+
+    Args:
+        path (str | Path): Path to the font file.
+        size (int): Point size of the font.
+
+    Returns:
+        pygame.freetype.Font: The shared font object.
+    """
+    key = (str(path), size)
+    font = _cache.get(key)
+    if font is None:
+        pygame.freetype.init()
+        font = _cache[key] = pygame.freetype.Font(path, size)
+        font.pad = True
+    return font
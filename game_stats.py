@@ -61,9 +61,9 @@ class GameStats():
             None
         """
         self.path = self.settings.scores_file
-        if self.path.exists() and self.path.stat.__sizeof__() > 40:
-            contents = self.path.read_text()
-            scores = json.loads(contents)
+        if self.path.exists() and self.path.stat().st_size > 2:
+            with self.path.open('rb') as f:
+                scores = json.loads(f.read())
             self.hi_score = scores.get('hi_score', 0)
         else:
             self.hi_score = 0
@@ -146,8 +146,7 @@ class GameStats():
         Returns:
             None
         """
-        for alien in collisions.values():
-            self.score += self.settings.alien_points
+        self.score += self.settings.alien_points * len(collisions)
 
     def update_level(self):
         """
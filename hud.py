@@ -9,7 +9,8 @@ high score, level, and remaining ship lives in the Alien Invasion game.
 date: 12/15/2025
 """
 
-import pygame.font
+import pygame
+from font_cache import get_font
 # from alien_invasion import AlienInvasion
 # from typing import TYPE_CHECKING
 
@@ -30,8 +31,10 @@ class HUD:
         screen (pygame.Surface): The main game screen surface.
         boundaries (pygame.Rect): Rect representing the screen boundaries.
         game_stats (GameStats): Object holding current game statistics.
-        font (pygame.font.Font): Font used for rendering text elements.
+        font (pygame.freetype.Font): Font used for rendering text elements.
         padding (int): Space padding used for positioning elements.
+        score_blits, max_score_blits, hi_score_blits, level_blits (list): Glyph
+            surfaces and screen positions that make up each text field.
     """
     def __init__(self, game):
         """
@@ -49,23 +52,94 @@ class HUD:
         self.screen = game.screen
         self.boundaries = game.screen.get_rect()
         self.game_stats = game.game_stats
-        self.font = pygame.font.Font(self.settings.font_file, self.settings.HUD_font_size)
+        self.font = get_font(self.settings.font_file, self.settings.HUD_font_size)
         self.padding = 20
+        # Last value rendered for each field; -1 forces the first render
+        self._last_score = self._last_max = self._last_hi = self._last_level = -1
+        # Values are ints, so the ' ,' spec matches the old ' ,.0f' output
+        self._number_fmt = '{: ,}'.format
+        self._hi_score_fmt = '{: ,} #'.format
+        # All text fields are composited into one surface, rebuilt lazily on change
+        self._hud_text_surface = None
+        self._hud_text_pos = (0, 0)
+        # Field rects are created once and resized/repositioned in place on updates
+        self.score_rect = pygame.Rect(0, 0, 0, 0)
+        self.max_score_rect = pygame.Rect(0, 0, 0, 0)
+        self.hi_score_rect = pygame.Rect(0, 0, 0, 0)
+        self.level_rect = pygame.Rect(0, 0, 0, 0)
+        self._setup_glyphs()
         self._setup_life_image()
         self.update_scores()
         self.update_level()
 
+    def _setup_glyphs(self):
+        """
+        Pre-render the static labels and every character a number can contain.
+
+        Score text is then composed from these surfaces instead of rendering a
+        whole new string each time a value changes.
+
+        Returns:
+            None
+        """
+        color = self.settings.text_color
+        self._glyphs = {char: self.font.render(char, color)[0] for char in '0123456789, #'}
+        self._glyph_w = {char: glyph.get_width() for char, glyph in self._glyphs.items()}
+        self._labels = {label: self.font.render(label, color)[0]
+                        for label in ('Score: ', 'Max-Score: ', '# High Score: ', 'Level: ')}
+
+    def _compose_text(self, label, text):
+        """
+        Lay out a pre-rendered label followed by the glyphs of some text.
+
+        Args:
+            label (str): One of the labels rendered in _setup_glyphs.
+            text (str): Characters to place after the label (digits, commas, spaces, '#').
+
+        Returns:
+            tuple[list, tuple[int, int]]: (surface, offset) pairs relative to the top-left
+                                          corner, and the size of the whole field.
+        """
+        label_image = self._labels[label]
+        parts = [(label_image, (0, 0))]
+        x = label_image.get_width()
+        for char in text:
+            parts.append((self._glyphs[char], (x, 0)))
+            x += self._glyph_w[char]
+        return parts, (x, label_image.get_height())
+
+    def _place_text(self, parts, rect):
+        """
+        Turn composed (surface, offset) pairs into screen positions at a placed rect.
+
+        Args:
+            parts (list): Pairs returned by _compose_text.
+            rect (pygame.Rect): The field's rect after positioning.
+
+        Returns:
+            list: (surface, (x, y)) pairs ready for blits.
+        """
+        return [(image, (rect.x + x, rect.y + y)) for image, (x, y) in parts]
+
     def _setup_life_image(self):
         """
-        Load and scale the ship image used to represent remaining lives.
+        Load and scale the ship image used to represent remaining lives, and tile
+        it into a strip holding every life slot.
 
         Returns:
             None
         """
         self.life_image = pygame.image.load(self.settings.life_image)
-        self.life_image = pygame.transform.scale(self.life_image, (self.settings.life_w, self.settings.life_h))
+        self.life_image = pygame.transform.scale(self.life_image, (self.settings.life_w, self.settings.life_h)).convert_alpha()
         self.life_rect = self.life_image.get_rect()
 
+        # Tile every slot a game can show into one strip so the icons are a single blit
+        step = self.life_rect.width + self.padding
+        slots = self.settings.starting_ship_count + 2
+        self._lives_strip = pygame.Surface((slots * step, self.life_rect.height), pygame.SRCALPHA).convert_alpha()
+        self._lives_strip.blits([(self.life_image, (i * step, 0)) for i in range(slots)], doreturn=False)
+        self._lives_step = step
+        self._lives_area = pygame.Rect(0, 0, 0, self.life_rect.height)
 
     def update_scores(self):
         """
@@ -84,84 +158,101 @@ class HUD:
         """
         Render the current score text and position it on the screen.
 
+        Skips the render when the score has not changed since the last call.
+
         Returns:
             None
         """
-        score_str = f'Score: {self.game_stats.score: ,.0f}'
-        self.score_image = self.font.render(score_str, True, self.settings.text_color, None)
-        self.score_rect = self.score_image.get_rect()
-        self.score_rect.right = self.boundaries.right - self.padding
-        self.score_rect.top = self.max_score_rect.bottom + self.padding
+        if self.game_stats.score == self._last_score:
+            return
+        self._last_score = self.game_stats.score
+        parts, self.score_rect.size = self._compose_text('Score: ', self._number_fmt(self.game_stats.score))
+        self.score_rect.topright = (self.boundaries.right - self.padding, self.max_score_rect.bottom + self.padding)
+        self.score_blits = self._place_text(parts, self.score_rect)
+        self._hud_text_surface = None
 
     def _update_max_score(self):
         """
         Render the session max score text and position it on the screen.
 
+        Skips the render when the max score has not changed since the last call.
+
         Returns:
             None
         """
-        max_score_str = f'Max-Score: {self.game_stats.max_score: ,.0f}'
-        self.max_score_image = self.font.render(max_score_str, True, self.settings.text_color, None)
-        self.max_score_rect = self.max_score_image.get_rect()
-        self.max_score_rect.right = self.boundaries.right - self.padding
-        self.max_score_rect.top = self.padding
+        if self.game_stats.max_score == self._last_max:
+            return
+        self._last_max = self.game_stats.max_score
+        parts, self.max_score_rect.size = self._compose_text('Max-Score: ', self._number_fmt(self.game_stats.max_score))
+        self.max_score_rect.topright = (self.boundaries.right - self.padding, self.padding)
+        self.max_score_blits = self._place_text(parts, self.max_score_rect)
+        self._hud_text_surface = None
 
     def _update_hi_score(self):
         """
         Render the all-time high score text and position it centered at the top.
 
+        Skips the render when the high score has not changed since the last call.
+
         Returns:
             None
         """
-        hi_score_str = f'# High Score: {self.game_stats.hi_score: ,.0f} #'
-        self.hi_score_image = self.font.render(hi_score_str, True, self.settings.text_color, None)
-        self.hi_score_rect = self.hi_score_image.get_rect()
-        self.hi_score_rect.right = self.boundaries.right - self.padding
+        if self.game_stats.hi_score == self._last_hi:
+            return
+        self._last_hi = self.game_stats.hi_score
+        parts, self.hi_score_rect.size = self._compose_text('# High Score: ', self._hi_score_fmt(self.game_stats.hi_score))
         self.hi_score_rect.midtop = (self.boundaries.centerx, self.padding)
+        self.hi_score_blits = self._place_text(parts, self.hi_score_rect)
+        self._hud_text_surface = None
 
     def update_level(self):
         """
         Render the current level text and position it on the screen.
 
-        Should be called whenever the level changes.
+        Should be called whenever the level changes; skips the render when the
+        level is the same as last time.
 
         Returns:
             None
         """
-        level_str = f'Level: {self.game_stats.level: ,.0f}'
-        self.level_image = self.font.render(level_str, True, self.settings.text_color, None)
-        self.level_rect = self.level_image.get_rect()
-        self.level_rect.left =  self.padding
-        self.level_rect.top = self.life_rect.bottom + self.padding
-
-    def _draw_lives(self):
+        if self.game_stats.level == self._last_level:
+            return
+        self._last_level = self.game_stats.level
+        parts, self.level_rect.size = self._compose_text('Level: ', self._number_fmt(self.game_stats.level))
+        self.level_rect.topleft = (self.padding, self.life_rect.bottom + self.padding)
+        self.level_blits = self._place_text(parts, self.level_rect)
+        self._hud_text_surface = None
+
+    def _compose_hud_text(self):
         """
-        Draw icons representing the player's remaining ships (lives) in the top-left corner.
-
-        Draws one extra icon to represent the current active ship
-        (total icons = ships_left + 1).
+        Composite every text field into one surface covering just their union.
 
         Returns:
             None
         """
-        current_x = self.padding
-        current_y = self.padding
-        for _ in range(self.game_stats.ships_left + 1):
-            self.screen.blit(self.life_image, (current_x, current_y))
-            current_x += self.life_rect.width + self.padding
+        fields = (self.hi_score_blits, self.max_score_blits, self.score_blits, self.level_blits)
+        area = self.hi_score_rect.unionall([self.max_score_rect, self.score_rect, self.level_rect])
+        self._hud_text_surface = pygame.Surface(area.size, pygame.SRCALPHA).convert_alpha()
+        self._hud_text_surface.blits([(image, (x - area.x, y - area.y))
+                                      for blits in fields for image, (x, y) in blits], doreturn=False)
+        self._hud_text_pos = area.topleft
 
     def draw(self):
         """
         Draw all HUD elements to the screen.
 
         This includes high score, max score, current score, level, and remaining lives.
+        The text fields are one composited surface, sent to the screen together with
+        the lives in a single blits call. One extra life icon is drawn
+        to represent the current active ship (total icons = ships_left + 1).
 
         Returns:
             None
         """
-        self.screen.blit(self.hi_score_image, self.hi_score_rect)
-        self.screen.blit(self.max_score_image, self.max_score_rect)
-        self.screen.blit(self.score_image, self.score_rect)
-        self.screen.blit(self.level_image, self.level_rect)
-        self._draw_lives()
+        if self._hud_text_surface is None:
+            self._compose_hud_text()
+        sequence = [(self._hud_text_surface, self._hud_text_pos)]
+        self._lives_area.width = (self.game_stats.ships_left + 1) * self._lives_step
+        sequence.append((self._lives_strip, (self.padding, self.padding), self._lives_area))
+        self.screen.blits(sequence, doreturn=False)
 
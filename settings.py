@@ -11,6 +11,7 @@ date: 12/15/2025
 """
 
 from pathlib import Path
+import numpy as np
 
 class Settings:
     """
@@ -25,6 +26,7 @@ class Settings:
         screen_w (int): Screen width in pixels.
         screen_h (int): Screen height in pixels.
         FPS (int): Target frames per second.
+        max_frame_time (float): Longest frame time in seconds fed to movement updates.
         bg_file (Path): Path to background image.
         scores_file (Path): Path to JSON file storing the high score.
         ship_file (Path): Path to player ship image.
@@ -35,7 +37,21 @@ class Settings:
         laser_sound (Path): Path to laser firing sound effect.
         impact_sound (Path): Path to alien hit/explosion sound.
         music (Path): Path to background music (Imperial March).
+        ship_speed, bullet_speed, fleet_speed (float): Speeds in pixels per second,
+            read from one float32 array so difficulty scales them together.
     """
+    # Fixed attribute set: no per-instance __dict__, and misspelled settings fail loudly
+    __slots__ = (
+        'name', 'screen_w', 'screen_h', 'FPS', 'max_frame_time', 'bg_file',
+        'difficulty_scale', 'scores_file', 'ship_file', 'ship_w', 'ship_h',
+        'bullet_file', 'laser_sound', 'impact_sound', 'alien_file', 'alien_w',
+        'alien_h', 'fleet_direction', 'button_w', 'button_h', 'button_color',
+        'text_color', 'button_font_size', 'HUD_font_size', 'font_file',
+        'life_image', 'life_w', 'life_h', 'music',
+        '_speeds', 'starting_ship_count', 'bullet_w', 'bullet_h',
+        'bullet_amount', 'fleet_drop_speed', 'alien_points',
+    )
+
     def __init__(self):
         """
         Initialize static game settings, including asset paths and visual parameters.
@@ -48,6 +64,8 @@ class Settings:
         self.screen_w = 1000
         self.screen_h = 800
         self.FPS = 60
+        # Clamp long frames (window drags, the pause after a hit) so nothing jumps
+        self.max_frame_time = 0.05
         self.bg_file = Path.cwd() / 'Assets' / 'images' / 'StarBackground.png'
         """
         Star Wars stars background
@@ -130,20 +148,19 @@ class Settings:
         Initialize or reset settings that can change during gameplay.
 
         Sets starting values for speeds and limits. Called at the beginning
-        of each new game.
+        of each new game. Speeds are in pixels per second.
 
         Returns:
             None
         """
-        self.ship_speed = 5
+        # Ship, bullet, and fleet speeds, in that order
+        self._speeds = np.array([300.0, 420.0, 240.0], dtype=np.float32)
         self.starting_ship_count = 2
 
-        self.bullet_speed = 7
         self.bullet_w = 25
         self.bullet_h = 80
         self.bullet_amount = 5
 
-        self.fleet_speed = 4
         self.fleet_drop_speed = 50
         self.alien_points = 50
 
@@ -151,12 +168,40 @@ class Settings:
         """
         Increase game difficulty by scaling speeds.
 
-        Multiplies ship, bullet, and fleet speeds by the difficulty scale factor.
-        Called each time a level is completed.
+        Multiplies ship, bullet, and fleet speeds by the difficulty scale factor
+        in one array operation. Called each time a level is completed.
 
         Returns:
             None
         """
-        self.ship_speed *= self.difficulty_scale
-        self.bullet_speed *= self.difficulty_scale
-        self.fleet_speed *= self.difficulty_scale
\ No newline at end of file
+        self._speeds *= self.difficulty_scale
+
+    @property
+    def ship_speed(self):
+        """
+        Current ship speed in pixels per second.
+
+        Returns:
+            float: The ship speed.
+        """
+        return float(self._speeds[0])
+
+    @property
+    def bullet_speed(self):
+        """
+        Current bullet speed in pixels per second.
+
+        Returns:
+            float: The bullet speed.
+        """
+        return float(self._speeds[1])
+
+    @property
+    def fleet_speed(self):
+        """
+        Current fleet speed in pixels per second.
+
+        Returns:
+            float: The fleet speed.
+        """
+        return float(self._speeds[2])
\ No newline at end of file
@@ -4,8 +4,8 @@ Jonathan Carpenter
 
 This module defines the Ship class, representing the player-controlled TIE Fighter
 in the Star Wars-themed Alien Invasion game. It handles ship movement, firing,
-drawing, collision detection with aliens, and delegates bullet management to
-the associated Arsenal instance.
+and drawing, and delegates bullet management to the associated Arsenal
+instance. Collisions with aliens are detected by the AlienFleet.
 
 date: 12/15/2025
 """
@@ -23,8 +23,7 @@ class Ship:
     Player-controlled ship (TIE Fighter) class.
 
     Manages the ship's position, movement along the bottom of the screen,
-    firing lasers via the Arsenal, rendering, and basic collision detection
-    with aliens.
+    firing lasers via the Arsenal, and rendering.
 
     Attributes:
         game (AlienInvasion): Reference to the main game instance.
@@ -57,7 +56,7 @@ class Ship:
         self.boundaries = self.screen.get_rect()
 
         self.image = pygame.image.load(self.settings.ship_file)
-        self.image = pygame.transform.scale(self.image, (self.settings.ship_w, self.settings.ship_h))
+        self.image = pygame.transform.scale(self.image, (self.settings.ship_w, self.settings.ship_h)).convert_alpha()
 
         self.rect = self.image.get_rect()
         self._center_ship()
@@ -69,52 +68,64 @@ class Ship:
         """
         Center the ship horizontally at the bottom of the screen.
 
-        Also updates the precise floating-point x position.
+        The precise floating-point x position is set directly and the rect
+        follows it.
 
         Returns:
             None
         """
-        self.rect.midbottom = self.boundaries.midbottom
-        self.x = float(self.rect.x)
+        self.rect.bottom = self.boundaries.bottom
+        self.x = self.boundaries.centerx - self.rect.width / 2
+        self.rect.x = round(self.x)
 
-    def update(self):
+    def update(self, dt: float):
         """
         Update the ship's position and its arsenal based on movement flags.
 
         Called once per frame when the game is active.
 
+        Args:
+            dt (float): Seconds elapsed since the last frame.
+
         Returns:
             None
         """
         # updating the position of the ship
-        self._update_ship_movement()
-        self.arsenal.update_arsenal()
+        self._update_ship_movement(dt)
+        self.arsenal.update_arsenal(dt)
 
-    def _update_ship_movement(self):
+    def _update_ship_movement(self, dt: float):
         """
         Update the ship's horizontal position based on movement flags and boundaries.
 
+        Args:
+            dt (float): Seconds elapsed since the last frame.
+
         Returns:
             None
         """
-        if self.moving_right and self.rect.right < self.boundaries.right:
-            self.x += self.settings.ship_speed
-        if self.moving_left and self.rect.left > self.boundaries.left:
-            self.x -= self.settings.ship_speed
+        # The flags act as 0/1, so both directions collapse into one signed step
+        dx = (self.moving_right - self.moving_left) * self.settings.ship_speed * dt
+        self.x = min(max(self.x + dx, self.boundaries.left), self.boundaries.right - self.rect.width)
 
-        self.rect.x = self.x
+        # Only touch the rect when the whole-pixel position actually changes
+        new_x = round(self.x)
+        if new_x != self.rect.x:
+            self.rect.x = new_x
 
     def draw(self):
        """
         Draw the ship's bullets first (via arsenal) then the ship itself.
 
-        Ensures bullets appear behind the ship visually if overlapping.
+        Bullets and ship go out in one blits call, with the ship last so
+        bullets appear behind it visually if overlapping.
 
         Returns:
             None
         """
-       self.arsenal.draw()
-       self.screen.blit(self.image, self.rect)
+       sequence = self.arsenal.blit_sequence()
+       sequence.append((self.image, self.rect))
+       self.screen.blits(sequence, doreturn=False)
 
     def fire(self):
         """
@@ -126,20 +137,3 @@ class Ship:
             bool: True if a bullet was fired, False if limit reached.
         """
         return self.arsenal.fire_bullet()
-    
-    def check_collisions(self, other_group):
-        """
-        Check for collisions between the ship and sprites in another group (typically aliens).
-
-        If a collision occurs, the ship is immediately recentered.
-
-        Args:
-            other_group (pygame.sprite.Group): Group of sprites to check against (e.g., alien fleet).
-
-        Returns:
-            bool: True if a collision occurred, False otherwise.
-        """
-        if pygame.sprite.spritecollide(self, other_group, False):
-            self._center_ship()
-            return True
-        return False
\ No newline at end of file